@@ -1,5 +1,6 @@
 # apps/__init__.py
-from .base import BaseAppTracker, AppInfo, AppVersion
+from .base import BaseAppTracker, AppInfo, AppVersion, utcnow
+from .ratelimit import RateLimiter, RateLimitExceeded
 from .chrome import ChromeTracker
 from .vscode import VSCodeTracker
 
@@ -7,6 +8,9 @@ __all__ = [
     'BaseAppTracker',
     'AppInfo',
     'AppVersion',
+    'RateLimiter',
+    'RateLimitExceeded',
+    'utcnow',
     'ChromeTracker',
     'VSCodeTracker'
 ]
\ No newline at end of file
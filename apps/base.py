@@ -1,12 +1,25 @@
 # apps/base.py
 from dataclasses import dataclass, asdict
-from datetime import datetime
-from typing import List, Optional, Dict
+from datetime import datetime, timezone
+from typing import Tuple, Optional, Dict
+from urllib.parse import urlsplit
 import aiohttp
+import orjson
 import logging
 import json
+from .ratelimit import RateLimiter, is_throttled, parse_retry_after
 
-@dataclass
+# Rate-limit reddinde en fazla kaç kez tekrar denenecek (1, 2, 4, ... saniye)
+MAX_RETRIES = 6
+
+# Bir isteğin tüm tekrar denemelerinde toplam beklenebilecek süre
+RETRY_BUDGET_SECONDS = 120
+
+def utcnow() -> datetime:
+    """Şu anki zamanı UTC (timezone-aware) olarak döndür"""
+    return datetime.now(timezone.utc)
+
+@dataclass(slots=True, frozen=True)
 class AppVersion:
     version: str
     architecture: str
@@ -19,12 +32,12 @@ class AppVersion:
         return {k: str(v) if isinstance(v, datetime) else v 
                 for k, v in asdict(self).items() if v is not None}
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppInfo:
     id: str
     name: str
     publisher: str
-    versions: List[AppVersion]
+    versions: Tuple[AppVersion, ...]
     homepage: str
     last_updated: datetime
 
@@ -35,16 +48,34 @@ class AppInfo:
             'publisher': self.publisher,
             'versions': [v.to_dict() for v in self.versions],
             'homepage': self.homepage,
-            'last_updated': self.last_updated.isoformat()
+            'last_updated': self.last_updated.isoformat(timespec="seconds")
         }
 
 class BaseAppTracker:
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None,
+                 http_cache: Optional[Dict[str, Dict]] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
         self.headers = {
             "User-Agent": "ShadeApi/1.0"
         }
+        # Tüm trackerlar aynı session'ı paylaşır (connection pool + keep-alive)
+        self._session = session
+        # URL -> {"etag", "last_modified", "body"}; koşullu istekler için
+        self._http_cache = http_cache if http_cache is not None else {}
+        # Host başına AIMD limiter; main.py tüm trackerlar için tek örnek verir
+        self._rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        # Bu çalıştırmada istenen URL'ler; kullanılmayan önbellek kayıtları atılır
+        self.requested_urls = set()
+        # Bu çalıştırmada gelen 200 ve 304 yanıtlarının sayısı
+        self._fresh_responses = 0
+        self._not_modified_responses = 0
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    @property
+    def not_modified(self) -> bool:
+        """Bu çalıştırmadaki tüm istekler 304 Not Modified ile mi döndü?"""
+        return self._not_modified_responses > 0 and self._fresh_responses == 0
+
     async def get_app_info(self) -> Optional[AppInfo]:
         """Her uygulama tracker'ı bu metodu implement etmeli"""
         raise NotImplementedError
@@ -52,10 +83,64 @@ class BaseAppTracker:
     async def _make_request(self, url: str) -> Dict:
         """Genel HTTP istek fonksiyonu"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self.headers) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            if self._session is None:
+                # Paylaşılan session verilmediyse tek seferlik session aç
+                async with aiohttp.ClientSession() as session:
+                    return await self._fetch_json(session, url)
+            return await self._fetch_json(self._session, url)
         except Exception as e:
             self.logger.error(f"Error making request to {url}: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    async def _fetch_json(self, session: aiohttp.ClientSession, url: str) -> Dict:
+        self.requested_urls.add(url)
+        headers = dict(self.headers)
+        cached = self._http_cache.get(url)
+        if cached:
+            # Önceki yanıtın doğrulayıcılarını gönder, değişmediyse 304 döner
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        host = urlsplit(url).hostname
+        waited = 0.0
+        for attempt in range(MAX_RETRIES + 1):
+            async with self._rate_limiter.guard(host) as limiter:
+                async with session.get(url, headers=headers) as response:
+                    limiter.observe(response)
+
+                    if is_throttled(response) and attempt < MAX_RETRIES:
+                        # Retry-After daha uzunsa o geçerli kalır
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        delay = max(2 ** attempt, retry_after or 0.0)
+                        if waited + delay <= RETRY_BUDGET_SECONDS:
+                            waited += delay
+                            limiter.block_for(delay)
+                            self.logger.warning(
+                                f"Rate limited by {host} (HTTP {response.status}), "
+                                f"retry {attempt + 1}/{MAX_RETRIES} in {delay:.0f}s"
+                            )
+                            continue
+                        self.logger.warning(f"Retry budget exhausted for {url}")
+
+                    if response.status == 304 and cached:
+                        self.logger.info(f"Not modified: {url}")
+                        self._not_modified_responses += 1
+                        return cached["body"]
+
+                    response.raise_for_status()
+                    # Gövdeyi tek seferde oku ve doğrudan orjson ile çöz
+                    raw = await response.read()
+                    data = orjson.loads(raw)
+                    self._fresh_responses += 1
+
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    if etag or last_modified:
+                        self._http_cache[url] = {
+                            "etag": etag,
+                            "last_modified": last_modified,
+                            "body": data
+                        }
+                    return data
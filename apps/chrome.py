@@ -1,13 +1,25 @@
 # apps/chrome.py
-from datetime import datetime
 from typing import Optional
-from .base import BaseAppTracker, AppInfo, AppVersion
+from .base import BaseAppTracker, AppInfo, AppVersion, utcnow
+
+# Sadece versiyon değişir; mimari, indirme adresi ve yaklaşık boyut sabittir
+_CHROME_VARIANTS = (
+    ("x64", "https://dl.google.com/chrome/install/ChromeStandaloneSetup64.exe", 85_000_000),
+    ("x86", "https://dl.google.com/chrome/install/ChromeStandaloneSetup.exe", 75_000_000)
+)
+
+_CHROME_INFO = {
+    "id": "chrome",
+    "name": "Google Chrome",
+    "publisher": "Google LLC",
+    "homepage": "https://www.google.com/chrome"
+}
 
 class ChromeTracker(BaseAppTracker):
     async def get_app_info(self) -> Optional[AppInfo]:
         try:
-            # Chrome versiyonunu Win64 için al
-            data = await self._make_request("https://chromiumdash.appspot.com/fetch_releases?channel=Stable&platform=Win64")
+            # Chrome versiyonunu Win64 için al (sadece en son sürüm istenir)
+            data = await self._make_request("https://chromiumdash.appspot.com/fetch_releases?channel=Stable&platform=Win64&num=1")
             if not data or not data[0]:
                 return None
 
@@ -16,30 +28,21 @@ class ChromeTracker(BaseAppTracker):
             if not latest_version:
                 return None
 
-            versions = [
-                AppVersion(
-                    version=latest_version,
-                    architecture="x64",
-                    url="https://dl.google.com/chrome/install/ChromeStandaloneSetup64.exe",
-                    type="exe",
-                    size=85000000  # Yaklaşık boyut
-                ),
+            versions = tuple(
                 AppVersion(
                     version=latest_version,
-                    architecture="x86",
-                    url="https://dl.google.com/chrome/install/ChromeStandaloneSetup.exe",
+                    architecture=arch,
+                    url=url,
                     type="exe",
-                    size=75000000  # Yaklaşık boyut
+                    size=size
                 )
-            ]
+                for arch, url, size in _CHROME_VARIANTS
+            )
 
             return AppInfo(
-                id="chrome",
-                name="Google Chrome",
-                publisher="Google LLC",
+                **_CHROME_INFO,
                 versions=versions,
-                homepage="https://www.google.com/chrome",
-                last_updated=datetime.now()
+                last_updated=utcnow()
             )
 
         except Exception as e:
@@ -0,0 +1,180 @@
+# apps/ratelimit.py
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+import aiohttp
+
+# Bu durum kodları sunucunun yük altında olduğunu gösterir
+THROTTLE_STATUSES = frozenset({429, 503})
+
+# Sunucu başlıkları bundan uzun bir bekleme isterse istek beklemeden başarısız olur
+MAX_BLOCK_SECONDS = 300
+
+# X-RateLimit-Reset bu değerden küçükse saniye cinsinden süre, büyükse epoch kabul edilir
+_EPOCH_THRESHOLD = 1_000_000_000
+
+class RateLimitExceeded(Exception):
+    """Host'un istediği bekleme süresi MAX_BLOCK_SECONDS'ı aşıyor"""
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After başlığını saniyeye çevir (saniye ya da HTTP tarihi)"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+def parse_rate_limit_reset(value: Optional[str]) -> Optional[float]:
+    """X-RateLimit-Reset başlığını kalan saniyeye çevir (süre, epoch saniye ya da epoch ms)"""
+    if not value:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if reset < _EPOCH_THRESHOLD:
+        return max(reset, 0.0)
+    if reset >= _EPOCH_THRESHOLD * 1000:
+        reset /= 1000
+    return max(reset - time.time(), 0.0)
+
+def is_throttled(response: aiohttp.ClientResponse) -> bool:
+    """Yanıt bir rate-limit reddi mi? (429/503 ya da limit bilgili 403)"""
+    if response.status in THROTTLE_STATUSES:
+        return True
+    headers = response.headers
+    return response.status == 403 and (
+        "Retry-After" in headers or headers.get("X-RateLimit-Remaining") == "0"
+    )
+
+class HostLimiter:
+    """Tek bir host için AIMD eşzamanlılık kontrolü ve dakikalık istek penceresi"""
+
+    def __init__(self, concurrency: int, min_concurrency: int,
+                 max_concurrency: int, requests_per_minute: Optional[int],
+                 min_remaining: int):
+        self.concurrency = concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.min_remaining = min_remaining
+        self._in_flight = 0
+        self._window = deque()
+        self._blocked_until = 0.0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.concurrency)
+            self._in_flight += 1
+
+        try:
+            while True:
+                now = time.monotonic()
+                while self._window and now - self._window[0] >= 60:
+                    self._window.popleft()
+
+                delay = self._blocked_until - now
+                if delay > MAX_BLOCK_SECONDS:
+                    raise RateLimitExceeded(
+                        f"host asked to wait {delay:.0f}s (limit {MAX_BLOCK_SECONDS}s)"
+                    )
+                if self.requests_per_minute and len(self._window) >= self.requests_per_minute:
+                    delay = max(delay, 60 - (now - self._window[0]))
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+
+            self._window.append(time.monotonic())
+        except BaseException:
+            await self.release()
+            raise
+
+    async def release(self):
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def increase(self):
+        """Başarılı istekte eşzamanlılığı bir artır (additive increase)"""
+        self.concurrency = min(self.concurrency + 1, self.max_concurrency)
+
+    def decrease(self):
+        """Kısıtlama ya da zaman aşımında eşzamanlılığı yarıya indir (multiplicative decrease)"""
+        self.concurrency = max(self.concurrency // 2, self.min_concurrency)
+
+    def block_for(self, seconds: float):
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def observe(self, response: aiohttp.ClientResponse):
+        """Yanıt durumuna ve rate-limit başlıklarına göre limitleri güncelle"""
+        headers = response.headers
+
+        if is_throttled(response):
+            self.decrease()
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                self.block_for(retry_after)
+
+        # Kalan istek hakkı eşiğin altına indiyse reset zamanına kadar bekle
+        out_of_quota = False
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            try:
+                out_of_quota = int(remaining) <= self.min_remaining
+            except ValueError:
+                pass
+        if out_of_quota:
+            reset = parse_rate_limit_reset(headers.get("X-RateLimit-Reset"))
+            if reset is not None:
+                self.block_for(reset)
+
+        if response.status < 400 and not out_of_quota:
+            self.increase()
+
+class RateLimiter:
+    """Host başına HostLimiter tutan, trackerlar arasında paylaşılan rate limiter"""
+
+    def __init__(self, concurrency: int = 4, min_concurrency: int = 1,
+                 max_concurrency: int = 8, requests_per_minute: Optional[int] = 60,
+                 min_remaining: int = 0):
+        self.concurrency = concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.min_remaining = min_remaining
+        self._hosts: Dict[str, HostLimiter] = {}
+
+    def for_host(self, host: str) -> HostLimiter:
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            limiter = HostLimiter(self.concurrency, self.min_concurrency,
+                                  self.max_concurrency, self.requests_per_minute,
+                                  self.min_remaining)
+            self._hosts[host] = limiter
+        return limiter
+
+    @asynccontextmanager
+    async def guard(self, host: str):
+        """İstek için host limitinden yer al, bağlantı hatasında limiti düşür"""
+        limiter = self.for_host(host)
+        await limiter.acquire()
+        try:
+            yield limiter
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+            limiter.decrease()
+            raise
+        finally:
+            await limiter.release()
@@ -9,27 +9,33 @@ class VSCodeTracker(BaseAppTracker):
             data = await self._make_request("https://update.code.visualstudio.com/api/releases/stable")
             latest = data[0]
             
+            version = latest["version"]
+            downloads = latest["downloads"]
+
             versions = []
-            for arch in ["win32-x64", "win32-arm64"]:
-                if arch in latest["downloads"]:
-                    versions.append(
-                        AppVersion(
-                            version=latest["version"],
-                            architecture=arch.split("-")[1],
-                            url=latest["downloads"][arch]["url"],
-                            hash=latest["downloads"][arch].get("sha256"),
-                            type="exe",
-                            size=latest["downloads"][arch].get("size")
-                        )
+            for arch in ("win32-x64", "win32-arm64"):
+                download = downloads.get(arch)
+                if download is None:
+                    continue
+
+                versions.append(
+                    AppVersion(
+                        version=version,
+                        architecture=arch[6:],  # "win32-" önekini at
+                        url=download["url"],
+                        hash=download.get("sha256"),
+                        type="exe",
+                        size=download.get("size")
                     )
+                )
 
             return AppInfo(
                 id="vscode",
                 name="Visual Studio Code",
                 publisher="Microsoft Corporation",
-                versions=versions,
+                versions=tuple(versions),
                 homepage="https://code.visualstudio.com",
-                last_updated=datetime.fromisoformat(latest["timestamp"].replace("Z", "+00:00"))
+                last_updated=datetime.fromisoformat(latest["timestamp"])
             )
 
         except Exception as e:
@@ -1,57 +1,147 @@
 # main.py
 import asyncio
-import json
+import aiohttp
+import orjson
 import logging
-from datetime import datetime
 from pathlib import Path
-from apps import ChromeTracker, VSCodeTracker
+from apps import BaseAppTracker, RateLimiter, utcnow
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tracker listesi (modül yüklenirken bir kez oluşturulur).
+# apps/__init__.py tüm tracker modüllerini import ettiği için
+# BaseAppTracker'ın alt sınıfları burada hazırdır.
+TRACKERS = tuple(BaseAppTracker.__subclasses__())
+
+# ETag/Last-Modified bilgilerinin çalıştırmalar arasında saklandığı dosya
+HTTP_CACHE_FILE = Path(".cache/http.json")
+
+# Bir önceki çalıştırmada yayınlanan uygulama verileri (id -> to_dict çıktısı)
+APP_CACHE_FILE = Path(".cache/apps.json")
+
+# Kalan istek hakkı bu sayıya inen host, reset zamanına kadar beklenir.
+# Her tracker çalıştırma başına host'a tek istek attığı için kota ayırmaya gerek yok;
+# 0, yalnızca kota tamamen bittiğinde beklemek anlamına gelir.
+RATE_LIMIT_MIN_REMAINING = 0
+
+# Aynı anda çalışabilecek en fazla tracker sayısı
+MAX_CONCURRENT_TRACKERS = 32
+
+def load_cache(path: Path) -> dict:
+    """Önceki çalıştırmadan kalan önbellek dosyasını oku"""
+    try:
+        return orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"Ignoring corrupt cache {path}: {e}")
+        return {}
+
+def save_cache(path: Path, cache: dict):
+    """Önbelleği bir sonraki çalıştırma için kaydet"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(cache))
+
+def write_jsonl(path: Path, records: list):
+    """Her kaydı ayrı bir satır olarak yaz (JSON Lines)"""
+    with open(path, "wb") as f:
+        for record in records:
+            f.write(orjson.dumps(record))
+            f.write(b"\n")
+
+async def run_tracker(tracker_cls, session: aiohttp.ClientSession,
+                      semaphore: asyncio.Semaphore, output_dir: Path,
+                      http_cache: dict, rate_limiter: RateLimiter,
+                      previous_apps: dict, used_urls: set):
+    """Tek bir tracker'ı çalıştır, sonucunu kaydet ve serileştirilmiş halini döndür"""
+    async with semaphore:
+        tracker = tracker_cls(session=session, http_cache=http_cache,
+                              rate_limiter=rate_limiter)
+        try:
+            logger.info(f"Running {tracker_cls.__name__}")
+            result = await tracker.get_app_info()
+            
+            if not result:
+                return None
+            
+            previous = previous_apps.get(result.id)
+            if tracker.not_modified and previous is not None:
+                # Kaynak değişmedi: önceki çıktı (last_updated dahil) aynen kullanılır
+                data = previous
+                logger.info(f"Not modified, reusing previous data for {result.id}")
+            else:
+                # to_dict bir kez çağrılır, index için de aynı sözlük kullanılır
+                data = result.to_dict()
+            
+            # Her uygulama için ayrı JSON dosyası oluştur
+            app_file = output_dir / f"{result.id}.json"
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            # Disk yazımı event loop'u bloklamasın
+            await asyncio.to_thread(app_file.write_bytes, payload)
+            logger.info(f"Saved data for {result.id}")
+            
+            return data
+        
+        except Exception as e:
+            logger.error(f"Error with {tracker_cls.__name__}: {e}")
+            raise
+        
+        finally:
+            used_urls.update(tracker.requested_urls)
+
 async def update_app_data():
     """Tüm trackerları çalıştır ve sonuçları kaydet"""
     output_dir = Path("docs/data")
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Tracker listesi
-    trackers = [
-        ChromeTracker(),
-        VSCodeTracker()
-    ]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRACKERS)
+    http_cache = load_cache(HTTP_CACHE_FILE)
+    previous_apps = load_cache(APP_CACHE_FILE)
+    used_urls = set()
+    # Host başına limitler tüm trackerlar arasında paylaşılır
+    rate_limiter = RateLimiter(max_concurrency=8,
+                               min_remaining=RATE_LIMIT_MIN_REMAINING)
     
-    results = []
+    # DNS sonuçları önbelleğe alınır, host başına bağlantı sayısı sınırlanır
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=8,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        enable_cleanup_closed=True
+    )
     
-    # Her tracker'ı çalıştır
-    for tracker in trackers:
-        try:
-            logger.info(f"Running {tracker.__class__.__name__}")
-            result = await tracker.get_app_info()
-            
-            if result:
-                results.append(result)
-                
-                # Her uygulama için ayrı JSON dosyası oluştur
-                app_file = output_dir / f"{result.id}.json"
-                with open(app_file, "w", encoding="utf-8") as f:
-                    json.dump(result.to_dict(), f, indent=2)
-                logger.info(f"Saved data for {result.id}")
-        
-        except Exception as e:
-            logger.error(f"Error with {tracker.__class__.__name__}: {e}")
+    # Tek bir session tüm trackerlar arasında paylaşılır
+    async with aiohttp.ClientSession(headers={"User-Agent": "ShadeApi/1.0"},
+                                     connector=connector) as session:
+        # Tüm trackerları eşzamanlı çalıştır
+        tasks = [run_tracker(cls, session, semaphore, output_dir, http_cache,
+                             rate_limiter, previous_apps, used_urls)
+                 for cls in TRACKERS]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    results = [r for r in outcomes if isinstance(r, dict)]
+    
+    # Sadece bu çalıştırmada istenen URL'lerin kayıtları saklanır
+    http_cache = {url: entry for url, entry in http_cache.items() if url in used_urls}
+    await asyncio.to_thread(save_cache, HTTP_CACHE_FILE, http_cache)
+    await asyncio.to_thread(save_cache, APP_CACHE_FILE, {app["id"]: app for app in results})
+    
+    # Index dosyasını oluştur: her satırda bir uygulama
+    index_file = output_dir / "index.jsonl"
+    await asyncio.to_thread(write_jsonl, index_file, results)
     
-    # Index dosyasını oluştur
-    index = {
-        "last_updated": datetime.now().isoformat(),
-        "total_apps": len(results),
-        "apps": [app.to_dict() for app in results]
+    meta = {
+        "last_updated": utcnow().isoformat(timespec="seconds"),
+        "total_apps": len(results)
     }
     
-    index_file = output_dir / "index.json"
-    with open(index_file, "w", encoding="utf-8") as f:
-        json.dump(index, f, indent=2)
+    meta_file = output_dir / "meta.json"
+    payload = orjson.dumps(meta, option=orjson.OPT_INDENT_2)
+    await asyncio.to_thread(meta_file.write_bytes, payload)
     
-    logger.info(f"Updated index.json with {len(results)} apps")
+    logger.info(f"Updated index.jsonl with {len(results)} apps")
 
 if __name__ == "__main__":
     asyncio.run(update_app_data())
\ No newline at end of file